@@ -5,11 +5,16 @@ Generate a PowerPoint deck from Netflix analysis
 - Builds a PPTX with executive summary and visuals
 """
 
+import io
 import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # headless raster backend; no GUI toolkit startup
 import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
 from datetime import datetime
 
 # pptx
@@ -18,8 +23,20 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
-sns.set(style="whitegrid")
+# Whitegrid look set once via rcParams; plain bar calls below skip the
+# per-call categorical/palette machinery seaborn.barplot adds on top
+plt.rcParams.update({
+    'axes.grid': True,
+    'grid.color': '.85',
+    'axes.axisbelow': True,
+})
+
+_DURATION_RE = re.compile(r'(\d+)')
 
+# Own snapshot file, separate from the dashboard's: the two scripts prepare
+# the frame differently (the dashboard sorts by year and adds extra derived
+# columns), so sharing one file would silently serve the wrong shape
+PARQUET_PATH = 'outputs/cleaned_netflix_slides.parquet'
 DATA_PATHS = [
     'outputs/cleaned_netflix.csv',
     'Netflix Dataset.csv',
@@ -31,7 +48,36 @@ os.makedirs(OUT_DIR, exist_ok=True)
 os.makedirs(CHART_DIR, exist_ok=True)
 
 
+def read_csv_fast(path):
+    """Read a CSV with pyarrow's multithreaded parser when available;
+    fall back to the pandas parser otherwise."""
+    try:
+        import pyarrow.csv as pacsv
+        return pacsv.read_csv(path).to_pandas()
+    except Exception:
+        return pd.read_csv(path)
+
+
+def snapshot_fresh():
+    """True when the Parquet snapshot exists and is at least as new as the
+    CSV the load would otherwise parse — a stale snapshot silently pinning
+    old data is worse than one cold re-parse."""
+    if not os.path.exists(PARQUET_PATH):
+        return False
+    snap_mtime = os.path.getmtime(PARQUET_PATH)
+    for src in DATA_PATHS:
+        if os.path.exists(src):
+            return os.path.getmtime(src) <= snap_mtime
+    return True
+
+
 def load_data():
+    # Prefer the Parquet snapshot: binary columnar decode skips CSV parsing
+    if snapshot_fresh():
+        df = pd.read_parquet(PARQUET_PATH, engine='pyarrow')
+        if 'duration_minutes' in df.columns:
+            return df
+        # Snapshot predates the derived columns; rebuild it from CSV below
     path = None
     for p in DATA_PATHS:
         if os.path.exists(p):
@@ -39,7 +85,7 @@ def load_data():
             break
     if not path:
         raise FileNotFoundError(f"Dataset not found. Checked {DATA_PATHS}")
-    df = pd.read_csv(path)
+    df = read_csv_fast(path)
     df.columns = [c.strip().lower().replace(' ', '_') for c in df.columns]
     # Map columns if raw csv
     if 'category' in df.columns:
@@ -48,89 +94,147 @@ def load_data():
         df = df.rename(columns={'type': 'listed_in'})
     if 'release_date' in df.columns:
         df = df.rename(columns={'release_date': 'date_added'})
-    df['date_added'] = pd.to_datetime(df.get('date_added'), errors='coerce')
+    dates = df.get('date_added')
+    if dates is not None and not pd.api.types.is_datetime64_any_dtype(dates):
+        if path == 'outputs/cleaned_netflix.csv':
+            # Cleaned CSV ships ISO dates; explicit format skips per-row inference
+            dates = pd.to_datetime(dates, format='ISO8601', errors='coerce')
+        else:
+            # Raw export uses 'September 9, 2019', occasionally space-padded
+            dates = pd.to_datetime(dates.astype(str).str.strip(), format='%B %d, %Y', errors='coerce')
+    df['date_added'] = dates
     df['year_added'] = df['date_added'].dt.year
+    if 'duration' in df.columns:
+        # Parse once here so chart code never re-runs the regex per call
+        df['duration_minutes'] = df['duration'].str.extract(_DURATION_RE, expand=False).astype('float32')
+    try:
+        df.to_parquet(PARQUET_PATH, engine='pyarrow', compression='zstd')
+    except Exception:
+        pass  # pyarrow missing; next run falls back to CSV again
     return df
 
 
-def save_matplotlib(fig, name):
-    path = os.path.join(CHART_DIR, name)
-    fig.savefig(path, bbox_inches='tight', dpi=200)
+def fig_to_png_bytes(fig):
+    # tight_layout + plain savefig renders once; bbox_inches='tight' would
+    # trigger a second render pass just to measure the bounds. 150 dpi is
+    # plenty for screen-resolution slides and quarters the PNG encode work.
+    fig.tight_layout()
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=150)
     plt.close(fig)
-    return path
-
-def save_plotly(fig, name):
-    """Save plotly figure as PNG using kaleido if available; return path or None."""
-    path = os.path.join(CHART_DIR, name)
-    try:
-        # Requires kaleido
-        fig.write_image(path, scale=2)
-        return path
-    except Exception as e:
-        print(f"[WARN] Could not export plotly image '{name}': {e}. Install 'kaleido' to enable static image export.")
-        return None
-
-def safe_mode(series, default='N/A'):
-    try:
-        m = series.mode(dropna=True)
-        return m.iloc[0] if not m.empty else default
-    except Exception:
-        return default
+    return buf.getvalue()
+
+
+# Chart renderers are top-level functions taking only the small aggregated
+# Series they plot, so they can run in worker processes without shipping the
+# full dataframe across the process boundary.
+
+def render_type_dist(vc):
+    fig, ax = plt.subplots(figsize=(5, 3))
+    ax.bar(vc.index.astype(str), vc.values, color=['#E50914', '#564d4d'][:len(vc)])
+    ax.set_title('Distribution: Movies vs TV Shows')
+    ax.set_xlabel('Type')
+    ax.set_ylabel('Count')
+    return fig_to_png_bytes(fig)
+
+
+def render_top_genres(genres):
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.barh(genres.index, genres.values, color='#E50914')
+    ax.invert_yaxis()
+    ax.set_title('Top 15 Genres')
+    ax.set_xlabel('Count')
+    ax.set_ylabel('Genre')
+    return fig_to_png_bytes(fig)
+
+
+def render_top_countries(countries):
+    fig, ax = plt.subplots(figsize=(6, 4))
+    ax.barh(countries.index, countries.values, color='#E50914')
+    ax.invert_yaxis()
+    ax.set_title('Top 15 Countries by Titles')
+    ax.set_xlabel('Count')
+    ax.set_ylabel('Country')
+    return fig_to_png_bytes(fig)
+
+
+def render_duration_hist(minutes):
+    fig, ax = plt.subplots(figsize=(6, 3))
+    ax.hist(minutes, bins=30, color='#E50914')
+    ax.set_title('Distribution of Movie Durations (min)')
+    ax.set_xlabel('Minutes')
+    ax.set_ylabel('Count')
+    return fig_to_png_bytes(fig)
+
+
+def render_per_year(per_year):
+    fig, ax = plt.subplots(figsize=(6, 3.5))
+    per_year.plot.area(ax=ax, color=['#E50914', '#564d4d'][:len(per_year.columns)])
+    ax.set_title('Content Added Per Year by Type')
+    ax.set_xlabel('Year')
+    ax.set_ylabel('Count')
+    ax.legend(title='')
+    return fig_to_png_bytes(fig)
+
+# Token counts memoized per (dataframe, column) so create_charts and build_ppt
+# share one tokenization pass instead of re-splitting the same strings
+_TOKEN_COUNT_CACHE = {}
+
+def count_tokens(df, column, sep=', '):
+    """Count separator-joined tokens in one pass, without an exploded Series.
+
+    Walks the raw values once and feeds them to a Counter (both C-implemented),
+    avoiding the intermediate Series that `str.split().explode()` materializes.
+    """
+    key = (id(df), column)
+    cached = _TOKEN_COUNT_CACHE.get(key)
+    if cached is None:
+        counts = Counter()
+        for value in df[column].dropna().values:
+            counts.update(value.split(sep))
+        cached = pd.Series(counts).sort_values(ascending=False)
+        _TOKEN_COUNT_CACHE[key] = cached
+    return cached
 
 
 def create_charts(df):
     charts = {}
 
-    # 1) Movies vs TV Shows
+    # The type distribution counts every row — deriving it from the per-year
+    # aggregate would drop the titles with no date and disagree with the
+    # executive-summary slide, which counts over the full frame
+    agg = None
+    vc = None
     if 'type' in df.columns:
         vc = df['type'].value_counts()
-        fig, ax = plt.subplots(figsize=(5, 3))
-        sns.barplot(x=vc.index, y=vc.values, ax=ax, palette=['#E50914', '#564d4d'])
-        ax.set_title('Distribution: Movies vs TV Shows')
-        ax.set_xlabel('Type')
-        ax.set_ylabel('Count')
-        charts['type_dist'] = save_matplotlib(fig, 'type_distribution.png')
-
-    # 2) Content added per year
-    if 'year_added' in df.columns and 'type' in df.columns:
-        year_counts = df.dropna(subset=['year_added']).groupby(['year_added','type']).size().reset_index(name='count')
-        fig = px.area(year_counts, x='year_added', y='count', color='type', title='Content Added Per Year by Type')
-        fig.update_layout(template='plotly_white')
-        area_path = save_plotly(fig, 'content_per_year.png')
-        if area_path:
-            charts['per_year'] = area_path
-
-    # 3) Top genres
+        if 'year_added' in df.columns:
+            agg = df.dropna(subset=['year_added']).groupby(['type', 'year_added']).size()
+
+    # Matplotlib rendering + PNG encoding is CPU-bound, so the independent
+    # charts are rendered in worker processes; each job carries only the
+    # small aggregate it plots.
+    jobs = {}
+    if vc is not None:
+        jobs['type_dist'] = (render_type_dist, vc, 'type_distribution.png')
     if 'listed_in' in df.columns:
-        genres = df['listed_in'].dropna().str.split(', ').explode().value_counts().head(15)
-        fig, ax = plt.subplots(figsize=(6, 4))
-        sns.barplot(y=genres.index, x=genres.values, ax=ax, palette='Reds_r')
-        ax.set_title('Top 15 Genres')
-        ax.set_xlabel('Count')
-        ax.set_ylabel('Genre')
-        charts['top_genres'] = save_matplotlib(fig, 'top_genres.png')
-
-    # 4) Top countries
+        jobs['top_genres'] = (render_top_genres, count_tokens(df, 'listed_in').head(15), 'top_genres.png')
     if 'country' in df.columns:
-        countries = df['country'].dropna().str.split(', ').explode().value_counts().head(15)
-        fig, ax = plt.subplots(figsize=(6, 4))
-        sns.barplot(y=countries.index, x=countries.values, ax=ax, palette='Reds_r')
-        ax.set_title('Top 15 Countries by Titles')
-        ax.set_xlabel('Count')
-        ax.set_ylabel('Country')
-        charts['top_countries'] = save_matplotlib(fig, 'top_countries.png')
-
-    # 5) Movie duration dist
-    if 'duration' in df.columns and 'type' in df.columns:
-        movies = df[df['type']=='Movie'].copy()
-        if not movies.empty:
-            movies['duration_minutes'] = movies['duration'].str.extract(r'(\d+)').astype(float)
-            fig, ax = plt.subplots(figsize=(6, 3))
-            ax.hist(movies['duration_minutes'].dropna(), bins=30, color='#E50914')
-            ax.set_title('Distribution of Movie Durations (min)')
-            ax.set_xlabel('Minutes')
-            ax.set_ylabel('Count')
-            charts['duration'] = save_matplotlib(fig, 'movie_duration.png')
+        jobs['top_countries'] = (render_top_countries, count_tokens(df, 'country').head(15), 'top_countries.png')
+    if 'duration_minutes' in df.columns and 'type' in df.columns:
+        minutes = df.loc[df['type'] == 'Movie', 'duration_minutes'].dropna().values
+        if len(minutes):
+            jobs['duration'] = (render_duration_hist, minutes, 'movie_duration.png')
+    if agg is not None:
+        jobs['per_year'] = (render_per_year, agg.unstack('type').fillna(0), 'content_per_year.png')
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as pool:
+            futures = {key: pool.submit(fn, data) for key, (fn, data, _) in jobs.items()}
+            for key, future in futures.items():
+                path = os.path.join(CHART_DIR, jobs[key][2])
+                with open(path, 'wb') as f:
+                    f.write(future.result())
+                charts[key] = path
 
     return charts
 
@@ -206,8 +310,10 @@ def build_ppt(df, charts):
     # Executive Summary
     movies = int((df['type']=='Movie').sum()) if 'type' in df.columns else 0
     tvshows = int((df['type']=='TV Show').sum()) if 'type' in df.columns else 0
-    top_genre = safe_mode(df['listed_in'].dropna().str.split(', ').explode()) if 'listed_in' in df.columns else 'N/A'
-    top_country = safe_mode(df['country'].dropna().str.split(', ').explode()) if 'country' in df.columns else 'N/A'
+    genre_counts = count_tokens(df, 'listed_in') if 'listed_in' in df.columns else pd.Series(dtype=int)
+    country_counts = count_tokens(df, 'country') if 'country' in df.columns else pd.Series(dtype=int)
+    top_genre = genre_counts.index[0] if len(genre_counts) else 'N/A'
+    top_country = country_counts.index[0] if len(country_counts) else 'N/A'
 
     slide_bullets(
         prs,
@@ -248,7 +354,15 @@ def build_ppt(df, charts):
     )
 
     out_path = os.path.join(OUT_DIR, 'Netflix_Analysis_Presentation.pptx')
-    prs.save(out_path)
+    # Assemble the zip in memory, then publish with a single atomic rename:
+    # one large write instead of many small part syscalls, and readers never
+    # observe a half-written deck
+    buf = io.BytesIO()
+    prs.save(buf)
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(buf.getbuffer())
+    os.replace(tmp_path, out_path)
     return out_path
 
 
@@ -4,18 +4,28 @@ A simple interactive frontend for exploring Netflix dataset insights
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from collections import Counter
+from itertools import chain
+import gzip
+import hashlib
+import io
 import os
-import random
-import matplotlib.pyplot as plt
+import re
 try:
     from wordcloud import WordCloud  # Optional dependency
     HAS_WORDCLOUD = True
 except Exception:
     HAS_WORDCLOUD = False
+try:
+    import pycountry  # Optional dependency; ISO-3 codes for the choropleth
+    HAS_PYCOUNTRY = True
+except Exception:
+    HAS_PYCOUNTRY = False
 
 # Page configuration
 st.set_page_config(
@@ -26,48 +36,52 @@ st.set_page_config(
 )
 
 # ---------------- Theme & Styling ---------------- #
+_THEMES = {
+    'Netflix': {
+        'bg': '#0c0c0f',
+        'surface': '#141423',
+        'card': '#1a1a2e',
+        'text': '#ffffff',
+        'muted': '#8c8c9c',
+        'primary': '#E50914',
+        'accent': '#831010',
+        'blue': '#0f3460',
+        'darkblue': '#16213e',
+    },
+    'Dark': {
+        'bg': '#0c0c0f',
+        'surface': '#141423',
+        'card': '#1a1a2e',
+        'text': '#e6e6e6',
+        'muted': '#b3b3b3',
+        'primary': '#E50914',
+        'accent': '#b20710',
+        'blue': '#0f3460',
+        'darkblue': '#16213e',
+    },
+    'Light': {
+        'bg': '#f8f9fa',
+        'surface': '#ffffff',
+        'card': '#ffffff',
+        'text': '#111111',
+        'muted': '#5c5c5c',
+        'primary': '#E50914',
+        'accent': '#b20710',
+        'blue': '#0f3460',
+        'darkblue': '#16213e',
+    },
+}
+
 def get_theme():
     theme_choice = st.session_state.get('theme', 'Netflix')
-    if theme_choice == 'Netflix':
-        return {
-            'bg': '#0c0c0f',
-            'surface': '#141423',
-            'card': '#1a1a2e',
-            'text': '#ffffff',
-            'muted': '#8c8c9c',
-            'primary': '#E50914',
-            'accent': '#831010',
-            'blue': '#0f3460',
-            'darkblue': '#16213e',
-        }
-    elif theme_choice == 'Dark':
-        return {
-            'bg': '#0c0c0f',
-            'surface': '#141423',
-            'card': '#1a1a2e',
-            'text': '#e6e6e6',
-            'muted': '#b3b3b3',
-            'primary': '#E50914',
-            'accent': '#b20710',
-            'blue': '#0f3460',
-            'darkblue': '#16213e',
-        }
-    else:  # Light
-        return {
-            'bg': '#f8f9fa',
-            'surface': '#ffffff',
-            'card': '#ffffff',
-            'text': '#111111',
-            'muted': '#5c5c5c',
-            'primary': '#E50914',
-            'accent': '#b20710',
-            'blue': '#0f3460',
-            'darkblue': '#16213e',
-        }
-
-def apply_base_css(t):
-    st.markdown(f"""
-        <style>
+    return _THEMES.get(theme_choice, _THEMES['Netflix'])
+
+# The ~300-line CSS block is formatted once per theme and memoized; reruns
+# just re-use the cached string instead of re-building the f-string
+@st.cache_data(show_spinner=False)
+def build_base_css(theme_choice):
+    t = _THEMES.get(theme_choice, _THEMES['Netflix'])
+    return f"""
         @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
         
         :root {{
@@ -334,12 +348,39 @@ def apply_base_css(t):
         ::-webkit-scrollbar-thumb:hover {{
             background: var(--accent);
         }}
-        </style>
-    """, unsafe_allow_html=True)
+    """
 
-def style_fig(fig, t):
-    fig.update_layout(
-        template='plotly_white',
+@st.cache_data(show_spinner=False)
+def write_theme_css(theme_choice):
+    """Write the theme stylesheet under static/ and return a content-hashed
+    URL; the browser then caches it across reruns instead of re-parsing an
+    inline block streamed over the websocket each time. Requires
+    server.enableStaticServing (see .streamlit/config.toml)."""
+    try:
+        css = build_base_css(theme_choice)
+        digest = hashlib.md5(css.encode('utf-8')).hexdigest()[:8]
+        os.makedirs('static', exist_ok=True)
+        name = f'theme_{theme_choice.lower()}.css'
+        with open(os.path.join('static', name), 'w', encoding='utf-8') as f:
+            f.write(css)
+        return f'app/static/{name}?v={digest}'
+    except Exception:
+        return None  # read-only disk; fall back to the inline block
+
+def apply_base_css(theme_choice):
+    url = write_theme_css(theme_choice)
+    if url:
+        st.markdown(f'<link rel="stylesheet" href="{url}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{build_base_css(theme_choice)}</style>", unsafe_allow_html=True)
+
+# One layout template per theme, built once and reused by every figure;
+# applying a prebuilt template skips Plotly's per-property validation that
+# dominates figure styling time
+@st.cache_resource
+def plotly_template(theme_choice):
+    t = _THEMES.get(theme_choice, _THEMES['Netflix'])
+    return go.layout.Template(layout=go.Layout(
         paper_bgcolor=t['card'],
         plot_bgcolor='rgba(0,0,0,0)',
         font=dict(color=t['text'], family='Inter, system-ui, -apple-system', size=12),
@@ -360,28 +401,178 @@ def style_fig(fig, t):
             font_size=12,
             font_family='Inter'
         ),
-        transition_duration=500
-    )
-    # Add subtle grid
-    fig.update_xaxes(gridcolor='rgba(229,9,20,0.1)', gridwidth=1)
-    fig.update_yaxes(gridcolor='rgba(229,9,20,0.1)', gridwidth=1)
+        transition_duration=500,
+        xaxis=dict(gridcolor='rgba(229,9,20,0.1)', gridwidth=1),
+        yaxis=dict(gridcolor='rgba(229,9,20,0.1)', gridwidth=1),
+    ))
+
+def style_fig(fig, t):
+    fig.update_layout(template=plotly_template(st.session_state.get('theme', 'Netflix')))
     return fig
 
-theme = get_theme()
-apply_base_css(theme)
+apply_base_css(st.session_state.get('theme', 'Netflix'))
+
+# Compiled once; duration strings look like "90 min" / "4 Seasons"
+_DURATION_RE = re.compile(r'(\d+)')
+
+# Word tokenizer for the description word cloud: 3+ letter words, compiled once
+_WORD_RE = re.compile(r'\w{3,}')
+
+# Parquet snapshot of the cleaned dataset; columnar binary load is much
+# faster than re-parsing CSV text on every cold start
+PARQUET_PATH = 'outputs/cleaned_netflix.parquet'
+
+def read_csv_fast(path, dtype=None):
+    """Read a CSV with pyarrow's multithreaded parser when available;
+    fall back to the pandas parser, typed up front so it skips the
+    inference pass and the later astype for those columns."""
+    try:
+        import pyarrow.csv as pacsv
+        return pacsv.read_csv(path).to_pandas()
+    except Exception:
+        return pd.read_csv(path, dtype=dtype)
+
+def parse_added_dates(series, iso):
+    """Vectorized date parsing with an explicit format: the cleaned CSV uses
+    ISO dates, the raw export uses 'September 9, 2019' (sometimes padded
+    with stray spaces, which also trip the inference parser)."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    if iso:
+        return pd.to_datetime(series, format='ISO8601', errors='coerce')
+    return pd.to_datetime(series.astype(str).str.strip(), format='%B %d, %Y', errors='coerce')
+
+def optimize_dtypes(df):
+    """Narrow dtypes once at load: Int16 years and categorical codes for the
+    low-cardinality columns so groupby/value_counts/isin run on int codes."""
+    for c in ('year_added', 'release_year', 'duration_minutes'):
+        if c in df.columns:
+            df[c] = df[c].astype('Int16')
+    for c in ('type', 'rating', 'country', 'listed_in'):
+        if c in df.columns:
+            df[c] = df[c].astype('category')
+    for c in ('title', 'description'):
+        if c in df.columns:
+            try:
+                # Arrow-backed strings give vectorized C kernels for
+                # contains/lower/split instead of a per-row Python loop
+                df[c] = df[c].astype('string[pyarrow]')
+            except Exception:
+                pass  # pyarrow not installed; object dtype still works
+    return df
+
+def build_token_arrays(exploded):
+    """Turn an exploded token Series into parallel (row_index, token_id)
+    arrays plus a vocabulary — a structure-of-arrays layout where every
+    downstream count is an np.bincount over int codes instead of a Python
+    pass over exploded strings."""
+    tok_id, vocab = pd.factorize(exploded.to_numpy())
+    return exploded.index.to_numpy(), tok_id.astype(np.int32), vocab
+
+def build_aux_structures(df):
+    """Explode each comma-joined column exactly once per load and collect the
+    results in a plain dict returned alongside the frame; defaults, fun facts
+    and the tabs then read the precomputed Series instead of re-splitting
+    strings every rerun. A dict rather than df.attrs on purpose: pandas
+    deep-copies attrs into every derived frame, which would tax each filter
+    mask and display slice with a copy of all of this."""
+    aux = {}
+    for col, name, tok_key in (('listed_in', 'genres', 'genre_tok'),
+                               ('country', 'countries', 'country_tok'),
+                               ('director', 'directors', 'director_tok'),
+                               ('cast', 'cast', 'cast_tok')):
+        if col in df.columns:
+            # astype(str) first: on pandas 3, .str.split over a categorical
+            # returns the list's string repr instead of a list, so exploding
+            # a categorical column directly yields un-split tokens
+            exploded = df[col].dropna().astype(str).str.split(', ').explode()
+            if tok_key:
+                aux[tok_key] = build_token_arrays(exploded)
+            # Categorical tokens: value_counts/mode/equality run on int codes
+            aux[f'{name}_exploded'] = exploded.astype('category')
+    if 'genres_exploded' in aux and 'year_added' in df.columns:
+        # Long-form (row, genre, year) frame for the trend chart; filtered
+        # views slice it by index instead of re-running split+explode
+        aux['genre_year'] = (pd.DataFrame({'genre': aux['genres_exploded']})
+                             .join(df['year_added']).dropna())
+    if 'year_added' in df.columns:
+        # When the frame is year-sorted (missing years last, mapped to inf),
+        # the range filter becomes a searchsorted slice instead of two masks
+        y = df['year_added'].to_numpy(dtype='float64', na_value=np.inf)
+        if len(y) == 0 or np.all(y[:-1] <= y[1:]):
+            aux['year_sorted'] = y
+        # Per-year title counts, shared by the fun facts and anything else
+        # that needs whole-dataset year totals
+        aux['year_counts'] = df['year_added'].value_counts()
+    if 'title' in df.columns:
+        # Lowercased once here so the title search is a case-sensitive
+        # literal scan instead of per-query case folding
+        aux['title_lc'] = df['title'].str.lower()
+    return aux
+
+def token_counts(tokens, row_labels=None, n=None):
+    """Token frequencies from the precomputed arrays, optionally restricted
+    to a set of row labels (the filtered frame's index).
+
+    Top-n selection uses np.argpartition — O(U) over U unique tokens plus a
+    sort of just the n winners — rather than fully sorting the vocabulary
+    (tens of thousands of names for the cast column)."""
+    row_idx, tok_id, vocab = tokens
+    if row_labels is not None:
+        tok_id = tok_id[np.isin(row_idx, row_labels)]
+    counts = np.bincount(tok_id, minlength=len(vocab))
+    if n is not None and n < counts.size:
+        idx = np.argpartition(-counts, n)[:n]
+    else:
+        idx = np.arange(counts.size)
+    idx = idx[np.argsort(-counts[idx], kind='stable')]
+    idx = idx[counts[idx] > 0]
+    return pd.Series(counts[idx], index=vocab[idx])
 
-# Load data function with caching
-@st.cache_data
+def save_parquet_snapshot(df):
+    """Persist the cleaned dataframe as Parquet so later loads skip CSV parsing."""
+    try:
+        df.to_parquet(PARQUET_PATH, engine='pyarrow', compression='zstd')
+    except Exception:
+        pass  # pyarrow missing or read-only disk; CSV fallback still works
+
+def snapshot_fresh():
+    """True when the Parquet snapshot exists and is at least as new as the
+    CSV the load would otherwise parse — a stale snapshot silently pinning
+    old data is worse than one cold re-parse."""
+    if not os.path.exists(PARQUET_PATH):
+        return False
+    snap_mtime = os.path.getmtime(PARQUET_PATH)
+    for src in ('outputs/cleaned_netflix.csv', 'Netflix Dataset.csv'):
+        if os.path.exists(src):
+            return os.path.getmtime(src) <= snap_mtime
+    return True
+
+# Load data function with caching. cache_resource returns the same object on
+# every rerun with no pickling/hashing of the frame; the returned dataframe is
+# shared across sessions and must never be mutated in place (filtered views
+# and .copy() only).
+@st.cache_resource
 def load_data():
-    """Load and prepare Netflix dataset"""
+    """Load and prepare the Netflix dataset; returns (df, aux) where aux
+    holds the precomputed token arrays and other derived structures."""
     try:
+        # Fastest path: Parquet snapshot written on a previous run
+        if snapshot_fresh():
+            df = pd.read_parquet(PARQUET_PATH, engine='pyarrow', memory_map=True)
+            if 'duration_minutes' in df.columns:
+                df = optimize_dtypes(df)
+                return df, build_aux_structures(df)
+            # Snapshot predates the derived columns; rebuild it below
         # Try to load cleaned data first
         if os.path.exists('outputs/cleaned_netflix.csv'):
-            df = pd.read_csv('outputs/cleaned_netflix.csv')
-            df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
+            df = read_csv_fast('outputs/cleaned_netflix.csv',
+                               dtype={'type': 'category', 'rating': 'category'})
+            df['date_added'] = parse_added_dates(df['date_added'], iso=True)
         else:
             # Load original data
-            df = pd.read_csv('Netflix Dataset.csv')
+            df = read_csv_fast('Netflix Dataset.csv',
+                               dtype={'Category': 'category', 'Rating': 'category'})
             df.columns = [c.strip().lower().replace(' ', '_') for c in df.columns]
             
             # Preserve original 'type' (often Movie/TV Show in some datasets, but sometimes genres)
@@ -400,16 +591,397 @@ def load_data():
                     df['listed_in'] = ''
             
             # Dates
-            df['date_added'] = pd.to_datetime(df.get('date_added'), errors='coerce')
+            if 'date_added' in df.columns:
+                df['date_added'] = parse_added_dates(df['date_added'], iso=False)
+            else:
+                df['date_added'] = pd.NaT
             df['year_added'] = df['date_added'].dt.year
-            
-        return df
+
+        # Typed derived columns computed once here so tab code never re-runs
+        # the regex/astype on every rerun
+        if 'duration' in df.columns:
+            df['duration_minutes'] = pd.to_numeric(df['duration'].str.extract(_DURATION_RE, expand=False), errors='coerce')
+        if 'date_added' in df.columns:
+            df['month_num'] = df['date_added'].dt.month.astype('Int8')
+        df = optimize_dtypes(df)
+        if 'year_added' in df.columns:
+            # Stable year sort so the year-range filter can slice instead
+            # of masking (see build_aux_structures)
+            df = df.sort_values('year_added', kind='mergesort', ignore_index=True)
+
+        save_parquet_snapshot(df)
+        return df, build_aux_structures(df)
     except Exception as e:
         st.error(f"Error loading data: {e}")
+        return None, None
+
+# Cached per-filter aggregations: keyed on the small filter tuple so repeated
+# filter states skip the explode/groupby work entirely (the `_frame` argument
+# is excluded from Streamlit's cache key by the leading underscore)
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_genre_counts(filter_key, _frame, _tokens=None, n=15):
+    if _tokens is not None:
+        return token_counts(_tokens, _frame.index.to_numpy(), n)
+    return _frame['listed_in'].dropna().astype(str).str.split(', ').explode().value_counts().head(n)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_country_counts(filter_key, _frame, _tokens=None, n=20):
+    if _tokens is not None:
+        return token_counts(_tokens, _frame.index.to_numpy(), n)
+    return _frame['country'].dropna().astype(str).str.split(', ').explode().value_counts().head(n)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def count_unique_tokens(filter_key, _series):
+    """Distinct comma-separated tokens via one streaming pass into a set,
+    skipping the exploded intermediate Series entirely."""
+    return len(set(chain.from_iterable(s.split(', ') for s in _series.dropna().values)))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_type_counts(filter_key, _frame):
+    # Drop zero-count entries: a categorical column keeps filtered-out
+    # categories in value_counts, which would put e.g. 'TV Show = 0' in
+    # the overview pie's legend
+    counts = _frame['type'].value_counts()
+    return counts[counts > 0]
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_rating_counts(filter_key, _frame, n=10):
+    """Top-n ratings from one np.bincount over the categorical's int codes
+    (a handful of categories, so a stable argsort of the counts is enough);
+    value_counts covers non-categorical frames."""
+    col = _frame['rating']
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        codes = col.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=col.cat.categories.size)
+        order = np.argsort(-counts, kind='stable')[:n]
+        order = order[counts[order] > 0]
+        return pd.Series(counts[order], index=col.cat.categories[order])
+    return col.value_counts().head(n)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_summary_stats(filter_key, _frame, _genre_tok=None, _country_tok=None):
+    """All five Summary Statistics card values in one cached pass, so a
+    rerun with an unchanged filter_key costs one dict lookup instead of
+    five separate frame scans."""
+    stats = {}
+    if 'duration_minutes' in _frame.columns and 'type' in _frame.columns:
+        avg = _frame.loc[_frame['type'] == 'Movie', 'duration_minutes'].mean()
+        stats['avg_duration'] = None if pd.isna(avg) else float(avg)
+    if 'listed_in' in _frame.columns:
+        genre_counts = compute_genre_counts(filter_key, _frame, _genre_tok)
+        if len(genre_counts):
+            stats['top_genre'] = genre_counts.index[0]
+    if 'country' in _frame.columns:
+        country_counts = compute_country_counts(filter_key, _frame, _country_tok)
+        if len(country_counts):
+            stats['top_country'] = country_counts.index[0]
+    if 'rating' in _frame.columns:
+        rating_counts = compute_rating_counts(filter_key, _frame)
+        if len(rating_counts):
+            stats['top_rating'] = rating_counts.index[0]
+    if 'year_added' in _frame.columns and _frame['year_added'].notna().any():
+        stats['latest_year_adds'] = int(
+            (_frame['year_added'] == _frame['year_added'].max()).sum())
+    return stats
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def hbar_figure(values, labels, title, xlabel, ylabel):
+    """Shared horizontal bar chart built straight from go.Bar: one layout
+    pass instead of px's per-property validation, memoized on the small
+    (values, labels) tuples so repeated filter states reuse the figure."""
+    fig = go.Figure(go.Bar(
+        x=list(values),
+        y=list(labels),
+        orientation='h',
+        marker=dict(color=list(values), colorscale='Reds', showscale=True),
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=xlabel,
+        yaxis_title=ylabel,
+        yaxis={'categoryorder': 'total ascending'},
+    )
+    return fig
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_filter_mask(filter_key, _df, _aux):
+    """Boolean row mask (~1 byte/row) for a filter state. Cached on the
+    widget tuple, so reruns that only touch non-filter widgets (search box,
+    rows-to-show, fun facts) reuse the mask instead of re-running the
+    filter chain."""
+    content_type, year_range, ratings, genres, countries = filter_key
+    if year_range is not None and _aux.get('year_sorted') is not None:
+        # Year-sorted frame: the range is a searchsorted slice of True
+        lo_i, hi_i = np.searchsorted(_aux['year_sorted'], [year_range[0], year_range[1] + 1])
+        mask = np.zeros(len(_df), dtype=bool)
+        mask[lo_i:hi_i] = True
+    elif year_range is not None:
+        yv = _df['year_added']
+        mask = ((yv >= year_range[0]) & (yv <= year_range[1])).fillna(False).to_numpy(dtype=bool)
+    else:
+        mask = np.ones(len(_df), dtype=bool)
+    if content_type and 'type' in _df.columns:
+        mask &= _df['type'].isin(content_type).to_numpy()
+    if ratings and 'rating' in _df.columns:
+        mask &= _df['rating'].isin(ratings).to_numpy()
+    if genres and 'genres_exploded' in _aux:
+        gm = _aux['genres_exploded']
+        mask &= np.isin(_df.index.to_numpy(), gm.index[gm.isin(genres)].unique().to_numpy())
+    if countries and 'countries_exploded' in _aux:
+        cm = _aux['countries_exploded']
+        mask &= np.isin(_df.index.to_numpy(), cm.index[cm.isin(countries)].unique().to_numpy())
+    return mask
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def pie_figure(values, labels, title):
+    """Cached pie chart; rebuilding and re-serializing Plotly figures every
+    rerun is pure overhead when the underlying counts haven't changed."""
+    fig = px.pie(values=list(values), names=list(labels), title=title,
+                 color_discrete_sequence=['#E50914', '#564d4d'])
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def vbar_figure(labels, values, title, xlabel, ylabel):
+    fig = go.Figure(go.Bar(
+        x=list(labels),
+        y=list(values),
+        marker=dict(color=list(values), colorscale='Reds', showscale=True),
+    ))
+    fig.update_layout(title=title, xaxis_title=xlabel, yaxis_title=ylabel)
+    return fig
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def choropleth_figure(countries, counts, title):
+    """Cached world map. With pycountry installed the names are resolved
+    to ISO-3 codes once here, which skips plotly's per-render fuzzy name
+    matching; unresolvable names fall back to 'country names' mode."""
+    locations, locationmode = list(countries), 'country names'
+    if HAS_PYCOUNTRY:
+        iso3 = []
+        for name in countries:
+            try:
+                iso3.append(pycountry.countries.lookup(name).alpha_3)
+            except LookupError:
+                break
+        else:
+            locations, locationmode = iso3, 'ISO-3'
+    return px.choropleth(
+        locations=locations,
+        locationmode=locationmode,
+        color=list(counts),
+        title=title,
+        color_continuous_scale='Reds',
+        labels={'color': 'Number of Titles'}
+    )
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_duration_hist(filter_key, _frame, bins=30):
+    """Server-side binning for the duration histogram: only the bin centers
+    and counts go over the wire instead of one value per movie."""
+    vals = _frame.loc[_frame['type'] == 'Movie', 'duration_minutes'].dropna().to_numpy(dtype='float64')
+    if len(vals) == 0:
+        return None
+    counts, edges = np.histogram(vals, bins=bins)
+    return counts, edges
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_year_type(filter_key, _frame):
+    # observed=True: only year/type pairs present in the data, no dense
+    # cartesian over the categorical codes
+    return _frame.groupby(['year_added', 'type'], observed=True).size().reset_index(name='count').dropna()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def top_exploded(filter_key, column, _series, _tokens=None, k=15):
+    """Top-k comma-separated tokens of a filtered column; `column` keeps the
+    cache entries for director/cast apart under the same filter key.
+
+    With precomputed token arrays this is an np.bincount over int codes
+    restricted to the filtered rows; the fallback streams str.split output
+    straight into a Counter — both C-implemented — instead of materializing
+    a one-row-per-name exploded Series."""
+    if _tokens is not None:
+        return token_counts(_tokens, _series.index.to_numpy(), k)
+    c = Counter()
+    for s in _series.dropna().values:
+        c.update(s.split(', '))
+    return pd.Series(dict(c.most_common(k)))
+
+_MONTH_LABELS = ['January', 'February', 'March', 'April', 'May', 'June',
+                 'July', 'August', 'September', 'October', 'November', 'December']
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_monthly_counts(filter_key, _frame):
+    """12-bin month histogram as one np.bincount over the month numbers —
+    no month-name string Series, no value_counts, no reindex. Reads the
+    month_num column precomputed at load; the dt.month fallback covers
+    snapshots written before that column existed."""
+    if 'month_num' in _frame.columns:
+        months = _frame['month_num'].to_numpy(dtype='float64', na_value=np.nan)
+    else:
+        months = _frame['date_added'].dt.month.to_numpy(dtype='float64', na_value=np.nan)
+    counts = np.bincount(months[~np.isnan(months)].astype(np.int64), minlength=13)[1:]
+    return pd.Series(counts, index=_MONTH_LABELS)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def filtered_csv_bytes(filter_key, _frame):
+    """Gzipped CSV bytes for the download button; pyarrow's multithreaded
+    CSV writer formats the rows when available, with pandas to_csv as the
+    fallback (mtime=0 keeps the compressed bytes stable for the cache)."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        buf = io.BytesIO()
+        pacsv.write_csv(pa.Table.from_pandas(_frame, preserve_index=False), buf)
+        raw = buf.getvalue()
+    except Exception:
+        raw = _frame.to_csv(index=False).encode('utf-8')
+    return gzip.compress(raw, mtime=0)
+
+def title_search_mask(title_lc, needle):
+    """Boolean hit mask for a literal title search. Calls Arrow's
+    match_substring kernel directly when pyarrow is available (the titles
+    are already lowercased and arrow-backed), with str.contains(regex=False)
+    as the fallback."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        hits = pc.fill_null(pc.match_substring(pa.Array.from_pandas(title_lc), needle), False)
+        return pd.Series(hits.to_numpy(zero_copy_only=False), index=title_lc.index)
+    except Exception:
+        return title_lc.str.contains(needle, regex=False, na=False)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def wordcloud_png(filter_key, _descriptions):
+    """Word-cloud PNG bytes per filter state. Tokenizes with one Counter
+    pass and a stopword set, then feeds generate_from_frequencies so
+    WordCloud never joins or re-tokenizes the multi-megabyte description
+    text. Caching encoded PNG bytes instead of the raw RGB array keeps
+    the cache entry ~50x smaller and skips re-encoding on every rerun."""
+    from wordcloud import STOPWORDS
+    stop = set(STOPWORDS)
+    c = Counter()
+    for d in _descriptions.dropna().astype(str).values:
+        c.update(w for w in _WORD_RE.findall(d.lower()) if w not in stop)
+    if not c:
         return None
+    wc = WordCloud(
+        width=1200,
+        height=400,
+        background_color='black',
+        colormap='Reds',
+        max_words=100,
+        relative_scaling=0.5,
+        min_font_size=10
+    ).generate_from_frequencies(dict(c.most_common(200)))
+    buf = io.BytesIO()
+    wc.to_image().save(buf, format='PNG')
+    return buf.getvalue()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_genre_time(filter_key, _frame, _genre_year=None, top_n=5):
+    """Counts per (year, genre) for the top-N genres; slices the precomputed
+    long-form frame when available. Plain groupby().size() on purpose: the
+    pandas numba engine only aggregates numeric columns, so it can never
+    apply to this genre grouping."""
+    if _genre_year is not None:
+        temp = _genre_year[_genre_year.index.isin(_frame.index)]
+    else:
+        temp = _frame[['listed_in', 'year_added']].dropna()
+        temp = temp.assign(genre=temp['listed_in'].astype(str).str.split(', ')).explode('genre')
+    top = temp['genre'].value_counts().head(top_n).index
+    counts = temp[temp['genre'].isin(top)].groupby(['year_added', 'genre'], observed=True).size()
+    return counts.reset_index(name='count')
+
+def safe_mode(series):
+    """Top value without Series.mode(), which sorts and materializes the
+    full frequency table just to return its head."""
+    try:
+        vc = series.value_counts(dropna=True)
+        return vc.index[0] if len(vc) else 'N/A'
+    except Exception:
+        return 'N/A'
+
+# Whole-dataset derivations: these depend only on the cached frame, so they
+# run once per session rather than on every widget interaction (`_df` is
+# excluded from the cache key; the loaded frame never changes in-session)
+@st.cache_data(show_spinner=False)
+def compute_defaults(_df, _aux):
+    defaults = {}
+    if 'type' in _df.columns:
+        defaults['content_type'] = (_df['type'].cat.categories.tolist()
+                                    if isinstance(_df['type'].dtype, pd.CategoricalDtype)
+                                    else list(_df['type'].unique()))
+    else:
+        defaults['content_type'] = []
+    if 'year_added' in _df.columns and _df['year_added'].notna().any():
+        defaults['year_range'] = (int(_df['year_added'].min()), int(_df['year_added'].max()))
+    else:
+        defaults['year_range'] = (2008, 2021)
+    defaults['ratings'] = sorted(_df['rating'].dropna().unique().tolist()) if 'rating' in _df.columns else []
+    defaults['genres'] = sorted(_aux['genres_exploded'].unique().tolist())[:20] if 'genres_exploded' in _aux else []
+    defaults['countries'] = sorted(_aux['countries_exploded'].value_counts().head(15).index.tolist()) if 'countries_exploded' in _aux else []
+    return defaults
+
+@st.cache_data(show_spinner=False)
+def compute_fun_facts(_df, _aux):
+    if 'countries_exploded' in _aux:
+        # The categorical vocabulary is exactly the distinct tokens
+        unique_countries = int(_aux['countries_exploded'].cat.categories.size)
+    elif 'country' in _df.columns:
+        unique_countries = count_unique_tokens(('__all__', 'country'), _df['country'])
+    else:
+        unique_countries = 0
+    # Per-year counts precomputed at load; one pass here only as a fallback
+    if 'year_counts' in _aux:
+        year_counts = _aux['year_counts']
+    elif 'year_added' in _df.columns:
+        year_counts = _df['year_added'].value_counts()
+    else:
+        year_counts = pd.Series(dtype=int)
+    max_year = year_counts.index.max() if len(year_counts) else None
+    latest_year_count = int(year_counts.get(max_year, 0)) if pd.notna(max_year) else 0
+    common_rating = safe_mode(_df['rating']) if 'rating' in _df.columns else 'N/A'
+    common_genre = safe_mode(_aux['genres_exploded']) if 'genres_exploded' in _aux else 'N/A'
+    avg_movie_mins = None
+    if 'duration_minutes' in _df.columns and 'type' in _df.columns:
+        avg_movie_mins = _df.loc[_df['type'] == 'Movie', 'duration_minutes'].mean()
+    # Int-code equality over the cached exploded tokens, not a per-row
+    # substring scan of the raw column
+    usa_titles = int((_aux['countries_exploded'] == 'United States').sum()) if 'countries_exploded' in _aux else 0
+    # Growth between earliest and latest counts
+    if len(year_counts):
+        earliest_year = year_counts.index.min()
+        e_cnt = int(year_counts.get(earliest_year, 0))
+        growth_pct = ((latest_year_count - e_cnt) / e_cnt * 100) if e_cnt else None
+    else:
+        growth_pct = None
+    top_director_titles = None
+    if 'directors_exploded' in _aux:
+        vc = _aux['directors_exploded'].value_counts()
+        top_director_titles = int(vc.iloc[0]) if len(vc) else None
+
+    fun_facts = []
+    fun_facts.append(f"🎬 Netflix has content from {unique_countries} countries!")
+    if pd.notna(max_year):
+        fun_facts.append(f"📺 The platform added {latest_year_count} titles in {int(max_year)}!")
+    if common_rating != 'N/A':
+        fun_facts.append(f"⭐ '{common_rating}' is the most common rating!")
+    if common_genre != 'N/A':
+        fun_facts.append(f"🎭 '{common_genre}' is the top genre!")
+    if avg_movie_mins and not pd.isna(avg_movie_mins):
+        fun_facts.append(f"🎥 Average movie duration is {avg_movie_mins:.0f} minutes!")
+    fun_facts.append(f"� USA produces {usa_titles} titles!")
+    if growth_pct is not None:
+        fun_facts.append(f"📈 Latest vs earliest year: {growth_pct:+.0f}% change")
+    if top_director_titles:
+        fun_facts.append(f"🎬 Top director has {top_director_titles} titles!")
+    if not fun_facts:
+        fun_facts.append("Explore the data to discover insights!")
+    return fun_facts
 
 # Load data
-df = load_data()
+df, aux = load_data()
 
 if df is not None:
     # Header
@@ -429,179 +1001,121 @@ if df is not None:
     current_theme = st.session_state.get('theme', 'Netflix')
     theme_index = theme_options.index(current_theme) if current_theme in theme_options else 0
     st.sidebar.selectbox("Theme", theme_options, index=theme_index, key='theme')
-    # Apply theme if changed
+    # WebGL rasterizes marks on the GPU instead of one SVG node per point;
+    # the toggle is an escape hatch for browsers without WebGL support
+    use_webgl = st.sidebar.checkbox("WebGL chart rendering", value=True, key='use_webgl')
+    # session_state['theme'] is already current when the script (re)starts,
+    # so the CSS emitted at the top of the run is the right one; no second
+    # injection needed here
     theme = get_theme()
-    apply_base_css(theme)
     
     # Defaults and Reset
-    def compute_defaults():
-        defaults = {}
-        defaults['content_type'] = list(df['type'].unique()) if 'type' in df.columns else []
-        if 'year_added' in df.columns and df['year_added'].notna().any():
-            defaults['year_range'] = (int(df['year_added'].min()), int(df['year_added'].max()))
-        else:
-            defaults['year_range'] = (2008, 2021)
-        defaults['ratings'] = sorted(df['rating'].dropna().unique().tolist()) if 'rating' in df.columns else []
-        defaults['genres'] = sorted(df['listed_in'].dropna().str.split(', ').explode().unique().tolist())[:20] if 'listed_in' in df.columns else []
-        defaults['countries'] = sorted(df['country'].dropna().str.split(', ').explode().value_counts().head(15).index.tolist()) if 'country' in df.columns else []
-        return defaults
-
-    defaults = compute_defaults()
+    defaults = compute_defaults(df, aux)
     if st.sidebar.button("↺ Reset Filters"):
         st.session_state['content_type'] = defaults['content_type']
         st.session_state['year_range'] = defaults['year_range']
         st.session_state['selected_ratings'] = defaults['ratings']
         st.session_state['selected_genres'] = []
         st.session_state['selected_countries'] = []
-        st.experimental_rerun()
-
-    # Sidebar filters grouped in expanders
-    with st.sidebar.expander("Content"):
-        content_type = st.multiselect(
-            "Select Content Type",
-            options=defaults['content_type'],
-            default=st.session_state.get('content_type', defaults['content_type']),
-            key='content_type'
-        )
+        st.rerun()
 
-    with st.sidebar.expander("Time Range"):
-        if 'year_added' in df.columns:
-            year_range = st.slider(
-                "Year Added Range",
-                min_value=defaults['year_range'][0],
-                max_value=defaults['year_range'][1],
-                value=st.session_state.get('year_range', defaults['year_range']),
-                key='year_range'
+    # Sidebar filters grouped in expanders inside one form: widget changes
+    # only trigger a rerun on Apply, so adjusting several filters costs a
+    # single recompute instead of one per widget interaction
+    with st.sidebar.form('filters'):
+        with st.expander("Content"):
+            content_type = st.multiselect(
+                "Select Content Type",
+                options=defaults['content_type'],
+                default=st.session_state.get('content_type', defaults['content_type']),
+                key='content_type'
             )
-    
-    # Additional filters
-    with st.sidebar.expander("Genres & Ratings"):
-        if 'rating' in df.columns:
-            all_ratings = defaults['ratings']
-            selected_ratings = st.multiselect(
-                "Select Ratings",
-                options=all_ratings,
-                default=st.session_state.get('selected_ratings', all_ratings),
-                key='selected_ratings'
-            )
-        else:
-            selected_ratings = []
-    
-        if 'listed_in' in df.columns:
-            all_genres = defaults['genres']
-            selected_genres = st.multiselect(
-                "Select Genres",
-                options=all_genres,
-                default=st.session_state.get('selected_genres', []),
-                key='selected_genres'
-            )
-        else:
-            selected_genres = []
-    
-    with st.sidebar.expander("Countries"):
-        if 'country' in df.columns:
-            top_countries = defaults['countries']
-            selected_countries = st.multiselect(
-                "Select Countries",
-                options=top_countries,
-                default=st.session_state.get('selected_countries', []),
-                key='selected_countries'
-            )
-        else:
-            selected_countries = []
+
+        with st.expander("Time Range"):
+            if 'year_added' in df.columns:
+                year_range = st.slider(
+                    "Year Added Range",
+                    min_value=defaults['year_range'][0],
+                    max_value=defaults['year_range'][1],
+                    value=st.session_state.get('year_range', defaults['year_range']),
+                    key='year_range'
+                )
+
+        # Additional filters
+        with st.expander("Genres & Ratings"):
+            if 'rating' in df.columns:
+                all_ratings = defaults['ratings']
+                selected_ratings = st.multiselect(
+                    "Select Ratings",
+                    options=all_ratings,
+                    default=st.session_state.get('selected_ratings', all_ratings),
+                    key='selected_ratings'
+                )
+            else:
+                selected_ratings = []
+
+            if 'listed_in' in df.columns:
+                all_genres = defaults['genres']
+                selected_genres = st.multiselect(
+                    "Select Genres",
+                    options=all_genres,
+                    default=st.session_state.get('selected_genres', []),
+                    key='selected_genres'
+                )
+            else:
+                selected_genres = []
+
+        with st.expander("Countries"):
+            if 'country' in df.columns:
+                top_countries = defaults['countries']
+                selected_countries = st.multiselect(
+                    "Select Countries",
+                    options=top_countries,
+                    default=st.session_state.get('selected_countries', []),
+                    key='selected_countries'
+                )
+            else:
+                selected_countries = []
+
+        st.form_submit_button("Apply Filters")
     
     # Fun Facts Section
     st.sidebar.markdown("---")
     st.sidebar.header("💡 Did You Know?")
-    
-    # Safe utilities
-    def safe_mode(series):
-        try:
-            m = series.mode(dropna=True)
-            return m.iloc[0] if not m.empty else 'N/A'
-        except Exception:
-            return 'N/A'
-
-    unique_countries = df['country'].dropna().str.split(', ').explode().nunique() if 'country' in df.columns else 0
-    max_year = df['year_added'].dropna().max() if 'year_added' in df.columns else None
-    latest_year_count = int(len(df[df['year_added'] == max_year])) if max_year == max_year and pd.notna(max_year) else 0
-    common_rating = safe_mode(df['rating']) if 'rating' in df.columns else 'N/A'
-    common_genre = safe_mode(df['listed_in'].dropna().str.split(', ').explode()) if 'listed_in' in df.columns else 'N/A'
-    avg_movie_mins = None
-    if 'duration' in df.columns and 'type' in df.columns:
-        try:
-            avg_movie_mins = df[df['type']=='Movie']['duration'].str.extract(r'(\d+)')[0].astype(float).mean()
-        except Exception:
-            avg_movie_mins = None
-    usa_titles = len(df[df['country'].str.contains('United States', na=False)]) if 'country' in df.columns else 0
-    # Growth between earliest and latest counts
-    if 'year_added' in df.columns and df['year_added'].notna().any():
-        earliest_year = df['year_added'].dropna().min()
-        e_cnt = len(df[df['year_added'] == earliest_year])
-        l_cnt = len(df[df['year_added'] == max_year]) if pd.notna(max_year) else 0
-        growth_pct = ((l_cnt - e_cnt) / e_cnt * 100) if e_cnt else None
-    else:
-        growth_pct = None
-    top_director_titles = None
-    if 'director' in df.columns and df['director'].notna().any():
-        vc = df['director'].dropna().str.split(', ').explode().value_counts()
-        top_director_titles = int(vc.iloc[0]) if len(vc) else None
 
-    fun_facts = []
-    fun_facts.append(f"🎬 Netflix has content from {unique_countries} countries!")
-    if pd.notna(max_year):
-        fun_facts.append(f"📺 The platform added {latest_year_count} titles in {int(max_year)}!")
-    if common_rating != 'N/A':
-        fun_facts.append(f"⭐ '{common_rating}' is the most common rating!")
-    if common_genre != 'N/A':
-        fun_facts.append(f"🎭 '{common_genre}' is the top genre!")
-    if avg_movie_mins and not pd.isna(avg_movie_mins):
-        fun_facts.append(f"🎥 Average movie duration is {avg_movie_mins:.0f} minutes!")
-    fun_facts.append(f"� USA produces {usa_titles} titles!")
-    if growth_pct is not None:
-        fun_facts.append(f"📈 Latest vs earliest year: {growth_pct:+.0f}% change")
-    if top_director_titles:
-        fun_facts.append(f"🎬 Top director has {top_director_titles} titles!")
-    if not fun_facts:
-        fun_facts.append("Explore the data to discover insights!")
-    
+    fun_facts = compute_fun_facts(df, aux)
+
     if st.sidebar.button("🔄 Refresh Fun Fact"):
-        st.session_state.fun_fact_index = random.randint(0, len(fun_facts) - 1)
-    
+        st.session_state.fun_fact_index = (st.session_state.get('fun_fact_index', -1) + 1) % len(fun_facts)
+
     if 'fun_fact_index' not in st.session_state:
-        st.session_state.fun_fact_index = random.randint(0, len(fun_facts) - 1)
-    
+        st.session_state.fun_fact_index = 0
+
     st.sidebar.info(fun_facts[st.session_state.fun_fact_index])
     
-    # Filter data
-    if 'type' in df.columns and content_type:
-        filtered_df = df[df['type'].isin(content_type)]
-    else:
-        filtered_df = df.copy()
-    
-    if 'year_added' in df.columns:
-        filtered_df = filtered_df[
-            (filtered_df['year_added'] >= year_range[0]) & 
-            (filtered_df['year_added'] <= year_range[1])
-        ]
-    
-    # Apply additional filters
-    if selected_ratings and 'rating' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['rating'].isin(selected_ratings)]
-    
-    if selected_genres and 'listed_in' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['listed_in'].str.contains('|'.join(selected_genres), na=False)]
-    
-    if selected_countries and 'country' in filtered_df.columns:
-        filtered_df = filtered_df[filtered_df['country'].str.contains('|'.join(selected_countries), na=False)]
-    
+    # Hashable fingerprint of the current filter state: the cache key for the
+    # filter mask and all per-filter aggregation helpers
+    filter_key = (
+        tuple(sorted(content_type)),
+        tuple(year_range) if 'year_added' in df.columns else None,
+        tuple(sorted(selected_ratings)),
+        tuple(sorted(selected_genres)),
+        tuple(sorted(selected_countries)),
+    )
+
+    # Filter data through the cached boolean mask (searchsorted year slice,
+    # int-code isin for type/rating and exact token membership for
+    # genres/countries — see compute_filter_mask)
+    filtered_df = df[compute_filter_mask(filter_key, df, aux)]
+
     # Key Metrics
     st.markdown('<h3 class="section-title">📈 Key Metrics</h3>', unsafe_allow_html=True)
     col1, col2, col3, col4 = st.columns(4)
     total_titles = f"{len(filtered_df):,}"
-    movies = len(filtered_df[filtered_df['type'] == 'Movie']) if 'type' in filtered_df.columns else 0
-    tv_shows = len(filtered_df[filtered_df['type'] == 'TV Show']) if 'type' in filtered_df.columns else 0
-    countries = filtered_df['country'].dropna().str.split(', ').explode().nunique() if 'country' in filtered_df.columns else 0
+    type_counts = compute_type_counts(filter_key, filtered_df) if 'type' in filtered_df.columns else pd.Series(dtype=int)
+    movies = int(type_counts.get('Movie', 0))
+    tv_shows = int(type_counts.get('TV Show', 0))
+    countries = count_unique_tokens(filter_key, filtered_df['country']) if 'country' in filtered_df.columns else 0
     with col1:
         st.markdown(f"<div class='kpi'><div class='label'>Total Titles</div><div class='value'>📚 {total_titles}</div></div>", unsafe_allow_html=True)
     with col2:
@@ -614,119 +1128,103 @@ if df is not None:
     # Summary Statistics Cards
     st.markdown('<h3 class="section-title">📊 Summary Statistics</h3>', unsafe_allow_html=True)
     col1, col2, col3, col4, col5 = st.columns(5)
-    
+
+    # One cached pass produces all five card values; the top-value metrics
+    # still share the same cached counts the tab charts use
+    summary = compute_summary_stats(filter_key, filtered_df,
+                                    aux.get('genre_tok'),
+                                    aux.get('country_tok'))
+
     with col1:
-        if 'duration' in filtered_df.columns and 'type' in filtered_df.columns:
-            avg_duration = filtered_df[filtered_df['type']=='Movie']['duration'].str.extract(r'(\d+)')[0].astype(float).mean()
-            st.metric("Avg Movie Length", f"{avg_duration:.0f} min")
-    
+        if summary.get('avg_duration') is not None:
+            st.metric("Avg Movie Length", f"{summary['avg_duration']:.0f} min")
+
     with col2:
-        if 'listed_in' in filtered_df.columns:
-            top_genre = filtered_df['listed_in'].dropna().str.split(', ').explode().mode()[0]
-            st.metric("Top Genre", f"{top_genre[:15]}...")
-    
+        if 'top_genre' in summary:
+            st.metric("Top Genre", f"{summary['top_genre'][:15]}...")
+
     with col3:
-        if 'country' in filtered_df.columns:
-            top_country = filtered_df['country'].dropna().str.split(', ').explode().mode()[0]
-            st.metric("Top Country", top_country)
-    
+        if 'top_country' in summary:
+            st.metric("Top Country", summary['top_country'])
+
     with col4:
-        if 'rating' in filtered_df.columns:
-            top_rating = filtered_df['rating'].mode()[0]
-            st.metric("Common Rating", top_rating)
-    
+        if 'top_rating' in summary:
+            st.metric("Common Rating", summary['top_rating'])
+
     with col5:
-        if 'year_added' in filtered_df.columns:
-            growth = len(filtered_df[filtered_df['year_added'] == filtered_df['year_added'].max()])
-            st.metric("Latest Year Adds", f"{growth:,}")
+        if 'latest_year_adds' in summary:
+            st.metric("Latest Year Adds", f"{summary['latest_year_adds']:,}")
     
     st.markdown("---")
     
-    # Main content - Tabs
-    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-        "📊 Overview", 
-        "🎭 Genres", 
-        "🌍 Geographic", 
-        "📅 Temporal",
-        "👥 Cast & Directors", 
-        "🔍 Explore Data"
-    ])
-    
+    # Main content - lazily rendered views: st.tabs executes every tab body
+    # on every rerun, so the radio dispatch below runs only the visible one
+    active_view = st.radio(
+        "View",
+        ["📊 Overview",
+         "🎭 Genres",
+         "🌍 Geographic",
+         "📅 Temporal",
+         "👥 Cast & Directors",
+         "🔍 Explore Data"],
+        horizontal=True,
+        label_visibility='collapsed',
+        key='active_view'
+    )
+
     # Tab 1: Overview
-    with tab1:
+    if active_view == "📊 Overview":
         st.header("Content Distribution Overview")
         
         col1, col2 = st.columns(2)
         
         with col1:
             if 'type' in filtered_df.columns:
-                # Movies vs TV Shows pie chart
-                type_counts = filtered_df['type'].value_counts()
-                fig = px.pie(
-                    values=type_counts.values,
-                    names=type_counts.index,
-                    title="Movies vs TV Shows Distribution",
-                    color_discrete_sequence=['#E50914', '#564d4d']
-                )
-                fig.update_traces(textposition='inside', textinfo='percent+label')
+                # Movies vs TV Shows pie chart (same cached counts as the KPIs)
+                fig = pie_figure(tuple(type_counts.values.tolist()), tuple(type_counts.index),
+                                 "Movies vs TV Shows Distribution")
                 st.plotly_chart(style_fig(fig, theme), use_container_width=True)
         
         with col2:
             if 'rating' in filtered_df.columns:
                 # Top ratings bar chart
-                rating_counts = filtered_df['rating'].value_counts().head(10)
-                fig = px.bar(
-                    x=rating_counts.values,
-                    y=rating_counts.index,
-                    orientation='h',
-                    title="Top 10 Content Ratings",
-                    labels={'x': 'Count', 'y': 'Rating'},
-                    color=rating_counts.values,
-                    color_continuous_scale='Reds'
-                )
+                rating_counts = compute_rating_counts(filter_key, filtered_df)
+                fig = hbar_figure(tuple(rating_counts.values.tolist()), tuple(rating_counts.index),
+                                  "Top 10 Content Ratings", 'Count', 'Rating')
                 st.plotly_chart(style_fig(fig, theme), use_container_width=True)
         
         # Duration analysis
-        if 'duration' in filtered_df.columns and 'type' in filtered_df.columns:
+        if 'duration_minutes' in filtered_df.columns and 'type' in filtered_df.columns:
             st.subheader("Duration Analysis")
-            
-            # Parse duration for movies
-            movies_df = filtered_df[filtered_df['type'] == 'Movie'].copy()
-            if len(movies_df) > 0:
-                movies_df['duration_minutes'] = movies_df['duration'].str.extract('(\d+)').astype(float)
-                
-                fig = px.histogram(
-                    movies_df,
-                    x='duration_minutes',
-                    nbins=30,
+
+            duration_hist = compute_duration_hist(filter_key, filtered_df)
+            if duration_hist is not None:
+                counts, edges = duration_hist
+                fig = go.Figure(go.Bar(
+                    x=(edges[:-1] + edges[1:]) / 2,
+                    y=counts,
+                    width=edges[1] - edges[0],
+                    marker_color='#E50914'
+                ))
+                fig.update_layout(
                     title="Movie Duration Distribution (minutes)",
-                    labels={'duration_minutes': 'Duration (minutes)', 'count': 'Number of Movies'},
-                    color_discrete_sequence=['#E50914']
+                    xaxis_title='Duration (minutes)',
+                    yaxis_title='Number of Movies'
                 )
                 st.plotly_chart(style_fig(fig, theme), use_container_width=True)
     
     # Tab 2: Genres
-    with tab2:
+    elif active_view == "🎭 Genres":
         st.header("Genre Analysis")
         
         if 'listed_in' in filtered_df.columns:
-            # Explode genres
-            genres_df = filtered_df['listed_in'].dropna().str.split(', ').explode()
-            genre_counts = genres_df.value_counts().head(15)
-            
+            genre_counts = compute_genre_counts(filter_key, filtered_df, aux.get('genre_tok'))
+
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                fig = px.bar(
-                    x=genre_counts.values,
-                    y=genre_counts.index,
-                    orientation='h',
-                    title="Top 15 Genres",
-                    labels={'x': 'Number of Titles', 'y': 'Genre'},
-                    color=genre_counts.values,
-                    color_continuous_scale='Reds'
-                )
-                fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+                fig = hbar_figure(tuple(genre_counts.values.tolist()), tuple(genre_counts.index),
+                                  "Top 15 Genres", 'Number of Titles', 'Genre')
                 st.plotly_chart(style_fig(fig, theme), use_container_width=True)
             
             with col2:
@@ -743,18 +1241,9 @@ if df is not None:
             # Genre trends over time
             if 'year_added' in filtered_df.columns:
                 st.subheader("Genre Trends Over Time")
-                
-                # Create exploded dataframe with year
-                temp_df = filtered_df[['listed_in', 'year_added']].dropna()
-                temp_df = temp_df.assign(genre=temp_df['listed_in'].str.split(', ')).explode('genre')
-                
-                # Get top 5 genres
-                top_genres = temp_df['genre'].value_counts().head(5).index
-                temp_df = temp_df[temp_df['genre'].isin(top_genres)]
-                
-                # Count by year and genre
-                genre_time = temp_df.groupby(['year_added', 'genre']).size().reset_index(name='count')
-                
+
+                genre_time = compute_genre_time(filter_key, filtered_df, aux.get('genre_year'))
+
                 fig = px.line(
                     genre_time,
                     x='year_added',
@@ -762,32 +1251,23 @@ if df is not None:
                     color='genre',
                     title='Top 5 Genre Trends Over Time',
                     labels={'year_added': 'Year', 'count': 'Number of Titles'},
-                    markers=True
+                    markers=True,
+                    render_mode='webgl' if use_webgl else 'svg'
                 )
                 st.plotly_chart(style_fig(fig, theme), use_container_width=True)
     
     # Tab 3: Geographic
-    with tab3:
+    elif active_view == "🌍 Geographic":
         st.header("Geographic Distribution")
         
         if 'country' in filtered_df.columns:
-            # Explode countries
-            countries_df = filtered_df['country'].dropna().str.split(', ').explode()
-            country_counts = countries_df.value_counts().head(20)
-            
+            country_counts = compute_country_counts(filter_key, filtered_df, aux.get('country_tok'))
+
             col1, col2 = st.columns([2, 1])
             
             with col1:
-                fig = px.bar(
-                    x=country_counts.values,
-                    y=country_counts.index,
-                    orientation='h',
-                    title="Top 20 Content Producing Countries",
-                    labels={'x': 'Number of Titles', 'y': 'Country'},
-                    color=country_counts.values,
-                    color_continuous_scale='Reds'
-                )
-                fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+                fig = hbar_figure(tuple(country_counts.values.tolist()), tuple(country_counts.index),
+                                  "Top 20 Content Producing Countries", 'Number of Titles', 'Country')
                 st.plotly_chart(fig, use_container_width=True)
             
             with col2:
@@ -801,68 +1281,55 @@ if df is not None:
                     height=500
                 )
             
-            # World map
+            # World map reuses the same cached counts as the bar chart
             st.subheader("Global Distribution Map")
-            country_df = pd.DataFrame({
-                'country': country_counts.index,
-                'count': country_counts.values
-            })
-            
-            fig = px.choropleth(
-                country_df,
-                locations='country',
-                locationmode='country names',
-                color='count',
-                title='Netflix Content by Country',
-                color_continuous_scale='Reds',
-                labels={'count': 'Number of Titles'}
-            )
+            fig = choropleth_figure(tuple(country_counts.index), tuple(country_counts.values.tolist()),
+                                    'Netflix Content by Country')
             st.plotly_chart(style_fig(fig, theme), use_container_width=True)
     
     # Tab 4: Temporal
-    with tab4:
+    elif active_view == "📅 Temporal":
         st.header("Temporal Analysis")
         
         if 'year_added' in filtered_df.columns and 'type' in filtered_df.columns:
             # Content added per year
-            year_type = filtered_df.groupby(['year_added', 'type']).size().reset_index(name='count')
-            year_type = year_type.dropna()
-            
-            fig = px.area(
-                year_type,
-                x='year_added',
-                y='count',
-                color='type',
+            year_type = compute_year_type(filter_key, filtered_df)
+
+            # Stacked area from cumulative per-type counts: Scattergl has no
+            # stackgroup, so the stacking is done here and the filled traces
+            # render on the GPU (Scatter fallback honors the WebGL toggle)
+            wide = year_type.pivot(index='year_added', columns='type', values='count').fillna(0)
+            cum = wide.cumsum(axis=1)
+            trace_cls = go.Scattergl if use_webgl else go.Scatter
+            palette = ['#E50914', '#564d4d']
+            fig = go.Figure()
+            for i, type_name in enumerate(wide.columns):
+                fig.add_trace(trace_cls(
+                    x=cum.index,
+                    y=cum[type_name],
+                    name=str(type_name),
+                    mode='lines',
+                    line=dict(color=palette[i % len(palette)]),
+                    fill='tozeroy' if i == 0 else 'tonexty',
+                ))
+            fig.update_layout(
                 title='Content Added Per Year by Type',
-                labels={'year_added': 'Year', 'count': 'Number of Titles'},
-                color_discrete_sequence=['#E50914', '#564d4d']
+                xaxis_title='Year',
+                yaxis_title='Number of Titles'
             )
             st.plotly_chart(fig, use_container_width=True)
             
             # Monthly trends
             if 'date_added' in filtered_df.columns:
                 st.subheader("Monthly Addition Patterns")
-                monthly_df = filtered_df.copy()
-                monthly_df['month'] = monthly_df['date_added'].dt.month_name()
-                monthly_counts = monthly_df['month'].value_counts()
-                
-                # Reorder by month
-                month_order = ['January', 'February', 'March', 'April', 'May', 'June',
-                              'July', 'August', 'September', 'October', 'November', 'December']
-                monthly_counts = monthly_counts.reindex([m for m in month_order if m in monthly_counts.index])
-                
-                fig = px.bar(
-                    x=monthly_counts.index,
-                    y=monthly_counts.values,
-                    title='Content Added by Month',
-                    labels={'x': 'Month', 'y': 'Number of Titles'},
-                    color=monthly_counts.values,
-                    color_continuous_scale='Reds'
-                )
+                monthly_counts = compute_monthly_counts(filter_key, filtered_df)
+
+                fig = vbar_figure(tuple(monthly_counts.index), tuple(monthly_counts.values.tolist()),
+                                  'Content Added by Month', 'Month', 'Number of Titles')
                 st.plotly_chart(style_fig(fig, theme), use_container_width=True)
     
     # Tab 5: Cast & Directors
-    with tab5:
+    elif active_view == "👥 Cast & Directors":
         st.header("👥 Top Cast & Directors")
         
         col1, col2 = st.columns(2)
@@ -870,19 +1337,12 @@ if df is not None:
         with col1:
             st.subheader("🎬 Most Prolific Directors")
             if 'director' in filtered_df.columns:
-                directors_df = filtered_df['director'].dropna().str.split(', ').explode()
-                top_directors = directors_df.value_counts().head(15)
+                top_directors = top_exploded(filter_key, 'director', filtered_df['director'],
+                                             aux.get('director_tok'))
                 
-                fig = px.bar(
-                    x=top_directors.values,
-                    y=top_directors.index,
-                    orientation='h',
-                    title="Top 15 Directors by Number of Titles",
-                    labels={'x': 'Number of Titles', 'y': 'Director'},
-                    color=top_directors.values,
-                    color_continuous_scale='Reds'
-                )
-                fig.update_layout(yaxis={'categoryorder': 'total ascending'})
+                fig = hbar_figure(tuple(top_directors.values.tolist()), tuple(top_directors.index),
+                                  'Top 15 Directors by Number of Titles',
+                                  'Number of Titles', 'Director')
                 st.plotly_chart(style_fig(fig, theme), use_container_width=True)
                 
                 # Directors table
@@ -898,20 +1358,13 @@ if df is not None:
         with col2:
             st.subheader("⭐ Most Featured Cast Members")
             if 'cast' in filtered_df.columns:
-                cast_df = filtered_df['cast'].dropna().str.split(', ').explode()
-                top_cast = cast_df.value_counts().head(15)
+                top_cast = top_exploded(filter_key, 'cast', filtered_df['cast'],
+                                        aux.get('cast_tok'))
                 
-                fig = px.bar(
-                    x=top_cast.values,
-                    y=top_cast.index,
-                    orientation='h',
-                    title="Top 15 Cast Members by Appearances",
-                    labels={'x': 'Number of Appearances', 'y': 'Cast Member'},
-                    color=top_cast.values,
-                    color_continuous_scale='Reds'
-                )
-                fig.update_layout(yaxis={'categoryorder': 'total ascending'})
-                st.plotly_chart(fig, use_container_width=True)
+                fig = hbar_figure(tuple(top_cast.values.tolist()), tuple(top_cast.index),
+                                  'Top 15 Cast Members by Appearances',
+                                  'Number of Appearances', 'Cast Member')
+                st.plotly_chart(style_fig(fig, theme), use_container_width=True)
                 
                 # Cast table
                 st.dataframe(
@@ -926,43 +1379,36 @@ if df is not None:
         # Word Cloud from Descriptions
         st.subheader("☁️ Content Themes Word Cloud")
         if HAS_WORDCLOUD and 'description' in filtered_df.columns:
-            descriptions_text = ' '.join(filtered_df['description'].dropna().astype(str))
-            
-            if descriptions_text:
-                try:
-                    wordcloud = WordCloud(
-                        width=1200, 
-                        height=400, 
-                        background_color='black',
-                        colormap='Reds',
-                        max_words=100,
-                        relative_scaling=0.5,
-                        min_font_size=10
-                    ).generate(descriptions_text)
-                    
-                    fig, ax = plt.subplots(figsize=(15, 5))
-                    ax.imshow(wordcloud, interpolation='bilinear')
-                    ax.axis('off')
-                    plt.tight_layout(pad=0)
-                    st.pyplot(fig)
-                    
-                    st.caption("Word cloud generated from content descriptions showing popular themes and keywords")
-                except Exception as e:
-                    st.warning(f"Could not generate word cloud: {e}")
+            try:
+                wc_png = wordcloud_png(filter_key, filtered_df['description'])
+            except Exception as e:
+                st.warning(f"Could not generate word cloud: {e}")
+                wc_png = None
+
+            if wc_png is not None:
+                st.image(wc_png, use_container_width=True)
+                st.caption("Word cloud generated from content descriptions showing popular themes and keywords")
         elif not HAS_WORDCLOUD:
             st.info("Install the 'wordcloud' package to enable this visualization.")
     
     # Tab 6: Explore Data
-    with tab6:
+    elif active_view == "🔍 Explore Data":
         st.header("Explore Raw Data")
         
         # Search functionality
         search_term = st.text_input("🔍 Search titles", "")
         
         if search_term:
-            search_results = filtered_df[
-                filtered_df['title'].str.contains(search_term, case=False, na=False)
-            ]
+            # Literal substring match against the precomputed lowercase
+            # titles — no regex compile, no per-query case folding
+            title_lc = aux.get('title_lc')
+            if title_lc is not None:
+                hits = title_search_mask(title_lc, search_term.lower())
+                search_results = filtered_df[filtered_df.index.isin(hits.index[hits])]
+            else:
+                search_results = filtered_df[
+                    filtered_df['title'].str.contains(search_term, case=False, na=False, regex=False)
+                ]
             st.write(f"Found {len(search_results)} results")
             display_df = search_results
         else:
@@ -981,12 +1427,12 @@ if df is not None:
         )
         
         # Download button
-        csv = filtered_df.to_csv(index=False).encode('utf-8')
+        csv = filtered_csv_bytes(filter_key, filtered_df)
         st.download_button(
-            label="📥 Download Filtered Data as CSV",
+            label="📥 Download Filtered Data as CSV (gzip)",
             data=csv,
-            file_name=f'netflix_filtered_{datetime.now().strftime("%Y%m%d")}.csv',
-            mime='text/csv',
+            file_name=f'netflix_filtered_{datetime.now().strftime("%Y%m%d")}.csv.gz',
+            mime='application/gzip',
         )
     
     # Footer